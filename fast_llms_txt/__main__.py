@@ -0,0 +1,6 @@
+"""Allow running the CLI with ``python -m fast_llms_txt``."""
+
+from .cli import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,68 @@
+"""Command-line interface for building llms.txt ahead of time."""
+
+import argparse
+import importlib
+import os
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI
+
+from .generator import generate_llms_txt
+
+
+def _load_app(app_ref: str) -> FastAPI:
+    """Import a FastAPI app from a "module:attribute" reference."""
+    module_name, _, attr_path = app_ref.partition(":")
+    if not module_name or not attr_path:
+        raise ValueError(f'App reference must be "module:attribute", got {app_ref!r}')
+
+    obj = importlib.import_module(module_name)
+    for attr in attr_path.split("."):
+        obj = getattr(obj, attr)
+
+    if not isinstance(obj, FastAPI):
+        raise ValueError(f"{app_ref!r} is not a FastAPI application")
+    return obj
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the fast-llms-txt command-line interface.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(prog="python -m fast_llms_txt")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser("build", help="Write llms.txt for a FastAPI app to a file")
+    build.add_argument("app", help='FastAPI app to document, as "module:attribute"')
+    build.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("llms.txt"),
+        help="Output file path (default: llms.txt)",
+    )
+
+    args = parser.parse_args(argv)
+
+    # Match uvicorn: resolve app modules relative to the working directory,
+    # without leaving it on sys.path for in-process callers
+    original_sys_path = sys.path[:]
+    sys.path.insert(0, os.getcwd())
+    try:
+        app = _load_app(args.app)
+    except (ImportError, AttributeError, ValueError) as e:
+        parser.error(str(e))
+    finally:
+        sys.path[:] = original_sys_path
+
+    try:
+        args.output.write_text(generate_llms_txt(app.openapi()), encoding="utf-8")
+    except OSError as e:
+        parser.error(f"cannot write {args.output}: {e.strerror or e}")
+    return 0
@@ -2,6 +2,12 @@
 
 from typing import Any
 
+# Operation keys rendered from each path item, in output order
+_HTTP_METHODS = ("get", "post", "put", "patch", "delete", "head", "options")
+
+# Local refs into components.schemas; the name is the final path segment
+_SCHEMA_REF_PREFIX = "#/components/schemas/"
+
 
 def generate_llms_txt(openapi_schema: dict[str, Any]) -> str:
     """Convert an OpenAPI schema to llms.txt markdown format.
@@ -37,7 +43,7 @@ def generate_llms_txt(openapi_schema: dict[str, Any]) -> str:
     endpoints_by_tag: dict[str, list[dict[str, Any]]] = {}
 
     for path, path_item in paths.items():
-        for method in ["get", "post", "put", "patch", "delete", "head", "options"]:
+        for method in _HTTP_METHODS:
             if method not in path_item:
                 continue
 
@@ -52,7 +58,7 @@ def generate_llms_txt(openapi_schema: dict[str, Any]) -> str:
                 "path": path,
                 "method": method.upper(),
                 "operation": operation,
-                "schemas": openapi_schema.get("components", {}).get("schemas", {}),
+                "schemas": schemas,
             })
 
     # Generate sections by tag
@@ -65,7 +71,14 @@ def generate_llms_txt(openapi_schema: dict[str, Any]) -> str:
 
         lines.append("")
 
-    return "\n".join(lines).strip() + "\n"
+    # Trim trailing blank lines before joining rather than stripping the
+    # joined document, which would copy the whole body twice more.
+    # The H1 title line is never blank, so the loop always terminates.
+    while not lines[-1].strip():
+        lines.pop()
+    lines[-1] = lines[-1].rstrip()
+    lines.append("")
+    return "\n".join(lines)
 
 
 def _format_endpoint(lines: list[str], endpoint: dict[str, Any]) -> None:
@@ -266,14 +279,18 @@ def _get_response_type(response: dict[str, Any], schemas: dict[str, Any]) -> str
 
 
 def _resolve_ref(schema: dict[str, Any], schemas: dict[str, Any]) -> dict[str, Any]:
-    """Resolve a $ref to its schema definition."""
+    """Resolve a $ref to its schema definition.
+
+    The definition is returned by reference, not copied, so repeated refs
+    to one name share a single dict. Callers must not mutate the result.
+    """
     ref = schema.get("$ref")
     if not ref:
         return schema
 
     # Handle #/components/schemas/Name format
-    if ref.startswith("#/components/schemas/"):
-        schema_name = ref.split("/")[-1]
+    if ref.startswith(_SCHEMA_REF_PREFIX):
+        schema_name = ref.rsplit("/", 1)[-1]
         return schemas.get(schema_name, schema)
 
     return schema
@@ -294,8 +311,8 @@ def _get_type_string(schema: dict[str, Any]) -> str:
 
     if "$ref" in schema:
         ref = schema["$ref"]
-        if ref.startswith("#/components/schemas/"):
-            return f"${ref.split('/')[-1]}"
+        if ref.startswith(_SCHEMA_REF_PREFIX):
+            return f"${ref.rsplit('/', 1)[-1]}"
         return "object"
 
     return schema_type
@@ -1,21 +1,51 @@
 """FastAPI router for serving llms.txt."""
 
-from fastapi import APIRouter, FastAPI
-from fastapi.responses import PlainTextResponse
+import gzip
+import hashlib
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, PlainTextResponse, Response
 
 from .generator import generate_llms_txt
 
 
-def create_llms_txt_router(app: FastAPI, path: str = "/llms.txt") -> APIRouter:
+class _RenderedLlmsTxt(NamedTuple):
+    """llms.txt body built from one OpenAPI schema, in every served form."""
+
+    # Held by reference so identity checks are safe from id() reuse
+    schema: dict[str, Any]
+    body: bytes
+    gzip_body: bytes | None
+    etag: str
+
+
+def create_llms_txt_router(
+    app: FastAPI,
+    path: str = "/llms.txt",
+    static_path: str | Path | None = None,
+) -> APIRouter:
     """Create a router that serves the llms.txt endpoint.
 
+    The generated markdown is cached as encoded bytes, plus a gzip copy for
+    clients that accept it, and only rebuilt when the app's OpenAPI schema
+    object changes. Responses carry an ETag so repeat clients can revalidate
+    with If-None-Match and get a 304.
+
     Args:
         app: The FastAPI application instance
         path: The path to mount the endpoint at (default: /llms.txt)
+        static_path: Serve this prebuilt file (see ``python -m fast_llms_txt
+            build``) instead of generating the markdown at runtime
 
     Returns:
         An APIRouter that can be included in the app
 
+    Raises:
+        FileNotFoundError: If static_path is given but does not exist
+
     Example:
         >>> from fastapi import FastAPI
         >>> from fast_llms_txt import create_llms_txt_router
@@ -23,7 +53,22 @@ def create_llms_txt_router(app: FastAPI, path: str = "/llms.txt") -> APIRouter:
         >>> app = FastAPI(title="My API")
         >>> app.include_router(create_llms_txt_router(app), prefix="/docs")
     """
+    if static_path is not None and not Path(static_path).is_file():
+        raise FileNotFoundError(f"llms.txt file not found: {static_path}")
+
     router = APIRouter()
+    # Replaced as a unit so concurrent builds never mix
+    cached: _RenderedLlmsTxt | None = None
+
+    def render() -> _RenderedLlmsTxt:
+        nonlocal cached
+        openapi_schema = app.openapi()
+        if cached is None or cached.schema is not openapi_schema:
+            body = generate_llms_txt(openapi_schema).encode("utf-8")
+            # Weak, since the gzip variant is semantically the same content
+            etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            cached = _RenderedLlmsTxt(openapi_schema, body, _compress(body), etag)
+        return cached
 
     @router.get(
         path,
@@ -31,9 +76,66 @@ def create_llms_txt_router(app: FastAPI, path: str = "/llms.txt") -> APIRouter:
         include_in_schema=False,
         summary="Get LLM-friendly API documentation",
     )
-    def get_llms_txt() -> str:
+    async def get_llms_txt(request: Request) -> Response:
         """Return the API documentation in llms.txt markdown format."""
-        openapi_schema = app.openapi()
-        return generate_llms_txt(openapi_schema)
+        if static_path is not None:
+            return FileResponse(static_path, media_type="text/plain; charset=utf-8")
+
+        if cached is None or app.openapi_schema is None:
+            # The OpenAPI schema has to be generated first; keep that and the
+            # llms.txt build off the event loop
+            rendered = await run_in_threadpool(render)
+        else:
+            # Go through app.openapi() rather than reading app.openapi_schema
+            # so FastAPI's route-change invalidation and any custom
+            # app.openapi override decide freshness; a hit is an identity check
+            rendered = render()
+
+        # no-cache: clients may store the body but must revalidate via ETag,
+        # so app changes show up immediately and unchanged docs cost a 304
+        headers = {"ETag": rendered.etag, "Cache-Control": "no-cache"}
+        if rendered.gzip_body is not None:
+            headers["Vary"] = "Accept-Encoding"
+
+        if _etag_matches(request.headers.get("if-none-match", ""), rendered.etag):
+            return Response(status_code=304, headers=headers)
+
+        # Returning a Response directly skips FastAPI's serialization step
+        if rendered.gzip_body is not None and _accepts_gzip(
+            request.headers.get("accept-encoding", "")
+        ):
+            headers["Content-Encoding"] = "gzip"
+            return PlainTextResponse(rendered.gzip_body, headers=headers)
+        return PlainTextResponse(rendered.body, headers=headers)
 
     return router
+
+
+def _compress(body: bytes) -> bytes | None:
+    """Gzip the body, or return None if compression does not shrink it."""
+    # mtime=0 keeps the output deterministic across rebuilds
+    compressed = gzip.compress(body, compresslevel=9, mtime=0)
+    return compressed if len(compressed) < len(body) else None
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Check whether an Accept-Encoding header allows a gzip response."""
+    qualities: dict[str, float] = {}
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        try:
+            quality = float(params.strip().removeprefix("q=")) if params else 1.0
+        except ValueError:
+            quality = 0.0
+        qualities[name.strip().lower()] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
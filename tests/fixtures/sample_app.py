@@ -228,7 +228,3 @@ def create_sample_app() -> FastAPI:
         return {"status": "ok"}
 
     return app
-
-
-# Convenience: create a default instance
-sample_app = create_sample_app()
@@ -1,53 +1,65 @@
 """Tests for the router module."""
 
+from collections.abc import Iterator
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from fast_llms_txt import create_llms_txt_router
+from fast_llms_txt import router as router_module
 
 
-class TestCreateLlmsTxtRouter:
-    """Tests for create_llms_txt_router function."""
+@pytest.fixture
+def generate_calls(monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+    """Record the schemas the router passes to generate_llms_txt."""
+    calls: list[dict] = []
+    original = router_module.generate_llms_txt
 
-    def test_default_path(self):
-        """Test that default path is /llms.txt."""
-        app = FastAPI(title="Test API")
-        app.include_router(create_llms_txt_router(app))
+    def counting_generate(openapi_schema):
+        calls.append(openapi_schema)
+        return original(openapi_schema)
 
-        client = TestClient(app)
-        response = client.get("/llms.txt")
+    monkeypatch.setattr(router_module, "generate_llms_txt", counting_generate)
+    return calls
 
-        assert response.status_code == 200
-
-    def test_custom_path(self):
-        """Test custom endpoint path."""
-        app = FastAPI(title="Test API")
-        app.include_router(create_llms_txt_router(app, path="/docs.txt"))
 
-        client = TestClient(app)
-        response = client.get("/docs.txt")
+@pytest.fixture(scope="module")
+def basic_app() -> FastAPI:
+    """Create a minimal app with the default router, shared by read-only tests."""
+    app = FastAPI(title="Test API")
+    app.include_router(create_llms_txt_router(app))
+    return app
 
-        assert response.status_code == 200
 
-    def test_with_prefix(self):
-        """Test router with prefix."""
-        app = FastAPI(title="Test API")
-        app.include_router(create_llms_txt_router(app), prefix="/api/v1/docs")
+@pytest.fixture(scope="module")
+def basic_client(basic_app: FastAPI) -> Iterator[TestClient]:
+    """Create a TestClient for the shared minimal app, running lifespan once."""
+    with TestClient(basic_app) as client:
+        yield client
 
-        client = TestClient(app)
-        response = client.get("/api/v1/docs/llms.txt")
 
-        assert response.status_code == 200
+class TestCreateLlmsTxtRouter:
+    """Tests for create_llms_txt_router function."""
 
-    def test_content_type(self):
-        """Test that response content type is text/plain."""
+    @pytest.mark.parametrize(
+        ("router_kwargs", "include_kwargs", "get_path"),
+        [
+            ({}, {}, "/llms.txt"),
+            ({"path": "/docs.txt"}, {}, "/docs.txt"),
+            ({}, {"prefix": "/api/v1/docs"}, "/api/v1/docs/llms.txt"),
+        ],
+        ids=["default_path", "custom_path", "with_prefix"],
+    )
+    def test_routing(self, router_kwargs, include_kwargs, get_path):
+        """Test that the endpoint is served as text/plain at the expected path."""
         app = FastAPI(title="Test API")
-        app.include_router(create_llms_txt_router(app))
+        app.include_router(create_llms_txt_router(app, **router_kwargs), **include_kwargs)
 
         client = TestClient(app)
-        response = client.get("/llms.txt")
+        response = client.get(get_path)
 
+        assert response.status_code == 200
         assert "text/plain" in response.headers["content-type"]
 
     def test_returns_markdown(self):
@@ -62,20 +74,19 @@ class TestCreateLlmsTxtRouter:
         app.include_router(create_llms_txt_router(app))
 
         client = TestClient(app)
-        response = client.get("/llms.txt")
+        body = client.get("/llms.txt").text
 
-        assert "# Test API" in response.text
-        assert "> A test API" in response.text
-        assert "GET /users" in response.text
+        assert "# Test API" in body
+        assert "> A test API" in body
+        assert "GET /users" in body
 
-    def test_endpoint_not_in_schema(self):
+    def test_endpoint_not_in_schema(self, basic_app: FastAPI, basic_client: TestClient):
         """Test that llms.txt endpoint is not included in OpenAPI schema."""
-        app = FastAPI(title="Test API")
-        app.include_router(create_llms_txt_router(app))
+        # Serving llms.txt populates FastAPI's cached schema; inspect that
+        # instead of building it a second time
+        basic_client.get("/llms.txt")
 
-        schema = app.openapi()
-
-        assert "/llms.txt" not in schema.get("paths", {})
+        assert "/llms.txt" not in basic_app.openapi_schema.get("paths", {})
 
     def test_reflects_app_changes(self):
         """Test that generated content reflects current app state."""
@@ -114,10 +125,10 @@ class TestCreateLlmsTxtRouter:
         app.include_router(create_llms_txt_router(app))
 
         client = TestClient(app)
-        response = client.get("/llms.txt")
+        body = client.get("/llms.txt").text
 
-        assert "## Users" in response.text
-        assert "## Posts" in response.text
+        assert "## Users" in body
+        assert "## Posts" in body
 
     def test_with_parameters(self):
         """Test that parameters are included."""
@@ -129,9 +140,202 @@ class TestCreateLlmsTxtRouter:
 
         app.include_router(create_llms_txt_router(app))
 
+        client = TestClient(app)
+        body = client.get("/llms.txt").text
+
+        assert "limit" in body
+        assert "offset" in body
+
+    def test_caches_generated_body(self, generate_calls: list[dict]):
+        """Test that markdown is only regenerated when the schema changes."""
+        app = FastAPI(title="Test API")
+        app.include_router(create_llms_txt_router(app))
+
+        client = TestClient(app)
+        response1 = client.get("/llms.txt")
+        response2 = client.get("/llms.txt")
+
+        assert response1.text == response2.text
+        assert len(generate_calls) == 1
+
+    def test_consults_app_openapi_on_cache_hits(self, generate_calls: list[dict]):
+        """Test that cache hits still ask app.openapi() whether the schema changed."""
+        app = FastAPI(title="Test API")
+        app.include_router(create_llms_txt_router(app))
+
+        openapi_calls = []
+        original_openapi = app.openapi
+
+        def counting_openapi():
+            openapi_calls.append(None)
+            return original_openapi()
+
+        app.openapi = counting_openapi
+
+        client = TestClient(app)
+        for _ in range(3):
+            client.get("/llms.txt")
+
+        assert len(openapi_calls) == 3
+        assert len(generate_calls) == 1
+
+    def test_rebuilds_after_schema_invalidation(self, generate_calls: list[dict]):
+        """Test that clearing the cached OpenAPI schema rebuilds the body once."""
+        app = FastAPI(title="Test API")
+        app.include_router(create_llms_txt_router(app))
+
+        client = TestClient(app)
+        response1 = client.get("/llms.txt")
+
+        app.openapi_schema = None
+        response2 = client.get("/llms.txt")
+        response3 = client.get("/llms.txt")
+
+        assert response2.text == response1.text
+        assert response3.text == response1.text
+        assert len(generate_calls) == 2
+        assert generate_calls[1] is app.openapi_schema
+
+    def test_schema_builds_run_in_threadpool(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that builds needing a new OpenAPI schema are kept off the event loop."""
+        offloaded = []
+        original = router_module.run_in_threadpool
+
+        async def counting_run_in_threadpool(func, *args, **kwargs):
+            offloaded.append(func)
+            return await original(func, *args, **kwargs)
+
+        monkeypatch.setattr(router_module, "run_in_threadpool", counting_run_in_threadpool)
+
+        app = FastAPI(title="Test API")
+        app.include_router(create_llms_txt_router(app))
+
+        client = TestClient(app)
+        client.get("/llms.txt")
+        client.get("/llms.txt")
+        assert len(offloaded) == 1
+
+        app.openapi_schema = None
+        client.get("/llms.txt")
+        client.get("/llms.txt")
+        assert len(offloaded) == 2
+
+    @pytest.mark.skipif(
+        not hasattr(FastAPI(), "_openapi_routes_version"),
+        reason="FastAPI release does not rebuild the OpenAPI schema on route changes",
+    )
+    def test_picks_up_routes_added_later(self):
+        """Test that routes added after the first request appear without a reset."""
+        app = FastAPI(title="Test API")
+        app.include_router(create_llms_txt_router(app))
+
+        client = TestClient(app)
+        assert "/users" not in client.get("/llms.txt").text
+
+        @app.get("/users")
+        def list_users():
+            return []
+
+        assert "/users" in client.get("/llms.txt").text
+
+    def test_custom_openapi_override(self, generate_calls: list[dict]):
+        """Test that apps replacing app.openapi are still served from cache."""
+        app = FastAPI(title="Test API")
+
+        def custom_openapi():
+            if app.openapi_schema is None:
+                app.openapi_schema = {"info": {"title": "Custom API"}, "paths": {}}
+            return app.openapi_schema
+
+        app.openapi = custom_openapi
+        app.include_router(create_llms_txt_router(app))
+
+        client = TestClient(app)
+        response1 = client.get("/llms.txt")
+        response2 = client.get("/llms.txt")
+
+        assert "# Custom API" in response1.text
+        assert response2.text == response1.text
+        assert len(generate_calls) == 1
+
+    def test_static_path(self, tmp_path):
+        """Test that a prebuilt file is served instead of generated content."""
+        static_file = tmp_path / "llms.txt"
+        static_file.write_text("# Prebuilt API\n", encoding="utf-8")
+
+        app = FastAPI(title="Test API")
+        app.include_router(create_llms_txt_router(app, static_path=static_file))
+
         client = TestClient(app)
         response = client.get("/llms.txt")
 
-        assert "limit" in response.text
-        assert "offset" in response.text
+        assert response.status_code == 200
+        assert response.text == "# Prebuilt API\n"
+        assert "text/plain" in response.headers["content-type"]
+
+    def test_static_path_missing(self, tmp_path):
+        """Test that a missing prebuilt file fails at router creation."""
+        app = FastAPI(title="Test API")
 
+        with pytest.raises(FileNotFoundError):
+            create_llms_txt_router(app, static_path=tmp_path / "missing.txt")
+
+    @pytest.mark.parametrize(
+        ("accept_encoding", "expected_encoding"),
+        [
+            ("gzip", "gzip"),
+            ("deflate, gzip;q=0.5", "gzip"),
+            ("*", "gzip"),
+            ("identity", None),
+            ("gzip;q=0", None),
+            ("gzip;q=0, *", None),
+            ("gzip;q=bogus", None),
+        ],
+    )
+    def test_gzip_encoding(self, sample_app: FastAPI, accept_encoding, expected_encoding):
+        """Test that a precompressed body is served when gzip is accepted."""
+        sample_app.include_router(create_llms_txt_router(sample_app))
+
+        client = TestClient(sample_app)
+        identity = client.get("/llms.txt", headers={"Accept-Encoding": "identity"})
+        response = client.get("/llms.txt", headers={"Accept-Encoding": accept_encoding})
+
+        assert response.headers.get("content-encoding") == expected_encoding
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.text == identity.text
+
+    def test_small_body_not_compressed(self, basic_client: TestClient):
+        """Test that bodies gzip cannot shrink are always sent uncompressed."""
+        response = basic_client.get("/llms.txt", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert "vary" not in response.headers
+
+    def test_etag_not_modified(self, basic_client: TestClient):
+        """Test that a matching If-None-Match returns 304 without a body."""
+        etag = basic_client.get("/llms.txt").headers["etag"]
+
+        for if_none_match in (etag, etag.removeprefix("W/"), f'"other", {etag}', "*"):
+            response = basic_client.get("/llms.txt", headers={"If-None-Match": if_none_match})
+            assert response.status_code == 304
+            assert response.headers["etag"] == etag
+            assert response.content == b""
+
+    def test_etag_changes_with_content(self):
+        """Test that a stale ETag gets the regenerated body."""
+        app = FastAPI(title="Test API")
+        app.include_router(create_llms_txt_router(app))
+
+        client = TestClient(app)
+        old_etag = client.get("/llms.txt").headers["etag"]
+
+        @app.get("/users")
+        def list_users():
+            return []
+
+        app.openapi_schema = None
+
+        response = client.get("/llms.txt", headers={"If-None-Match": old_etag})
+        assert response.status_code == 200
+        assert "/users" in response.text
+        assert response.headers["etag"] != old_etag
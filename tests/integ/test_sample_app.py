@@ -1,28 +1,38 @@
 """E2E tests validating llms.txt generation against a realistic FastAPI app."""
 
+from collections.abc import Iterator
+
 import pytest
-from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from fast_llms_txt import create_llms_txt_router
+from tests.fixtures.sample_app import create_sample_app
+
+
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    """Create a TestClient for a sample app with the llms.txt router included.
+
+    The app is built here rather than taken from the sample_app fixture so
+    that including the router never mutates an app another test may share.
+    """
+    app = create_sample_app()
+    app.include_router(create_llms_txt_router(app))
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def llms_txt(client: TestClient) -> str:
+    """Get the generated llms.txt content."""
+    response = client.get("/llms.txt")
+    assert response.status_code == 200
+    return response.text
 
 
 class TestSampleAppOutput:
     """Tests validating generated output against the sample app fixture."""
 
-    @pytest.fixture
-    def client(self, sample_app: FastAPI) -> TestClient:
-        """Create a TestClient with the llms.txt router included."""
-        sample_app.include_router(create_llms_txt_router(sample_app))
-        return TestClient(sample_app)
-
-    @pytest.fixture
-    def llms_txt(self, client: TestClient) -> str:
-        """Get the generated llms.txt content."""
-        response = client.get("/llms.txt")
-        assert response.status_code == 200
-        return response.text
-
     def test_api_metadata(self, llms_txt: str):
         """Test that API title and description are present."""
         assert "# Sample API" in llms_txt
@@ -0,0 +1,111 @@
+"""Tests for the cli module."""
+
+import runpy
+import sys
+from collections.abc import Iterator
+
+import pytest
+
+from fast_llms_txt.cli import main
+
+APP_MODULE = '''
+from fastapi import FastAPI
+
+app = FastAPI(title="CLI API")
+
+
+@app.get("/users")
+def list_users():
+    return []
+
+
+not_an_app = object()
+'''
+
+
+@pytest.fixture
+def app_module(tmp_path, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """Write an importable module containing a FastAPI app."""
+    (tmp_path / "cli_app.py").write_text(APP_MODULE, encoding="utf-8")
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "cli_app"
+    sys.modules.pop("cli_app", None)
+
+
+class TestBuild:
+    """Tests for the build command."""
+
+    def test_writes_output(self, app_module, tmp_path):
+        """Test that llms.txt is written to the output path."""
+        output = tmp_path / "out" / "llms.txt"
+        output.parent.mkdir()
+
+        assert main(["build", f"{app_module}:app", "-o", str(output)]) == 0
+
+        content = output.read_text(encoding="utf-8")
+        assert "# CLI API" in content
+        assert "GET /users" in content
+
+    def test_default_output(self, app_module, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        """Test that output defaults to llms.txt in the working directory."""
+        monkeypatch.chdir(tmp_path)
+
+        main(["build", f"{app_module}:app"])
+
+        assert (tmp_path / "llms.txt").is_file()
+
+    @pytest.mark.parametrize(
+        "app_ref",
+        ["cli_app", "cli_app:missing", "cli_app:not_an_app", "missing_module:app"],
+    )
+    def test_invalid_app_reference(self, app_module, app_ref, capsys):
+        """Test that bad app references exit with a usage error."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["build", app_ref])
+
+        assert exc_info.value.code == 2
+        assert "error:" in capsys.readouterr().err
+
+    def test_unwritable_output(self, app_module, tmp_path, capsys):
+        """Test that output write failures exit with a usage error."""
+        output = tmp_path / "missing_dir" / "llms.txt"
+
+        with pytest.raises(SystemExit) as exc_info:
+            main(["build", f"{app_module}:app", "-o", str(output)])
+
+        assert exc_info.value.code == 2
+        assert f"cannot write {output}" in capsys.readouterr().err
+
+    def test_does_not_leave_cwd_on_sys_path(self, app_module, tmp_path):
+        """Test that the working directory is only on sys.path during import."""
+        sys_path = list(sys.path)
+
+        main(["build", f"{app_module}:app", "-o", str(tmp_path / "llms.txt")])
+
+        assert sys.path == sys_path
+
+    def test_resolves_app_from_working_directory(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        """Test that app modules in the working directory are importable."""
+        (tmp_path / "cwd_app.py").write_text(APP_MODULE, encoding="utf-8")
+        monkeypatch.setattr(sys, "path", list(sys.path))
+        monkeypatch.chdir(tmp_path)
+
+        try:
+            main(["build", "cwd_app:app"])
+        finally:
+            sys.modules.pop("cwd_app", None)
+
+        assert "# CLI API" in (tmp_path / "llms.txt").read_text(encoding="utf-8")
+
+    def test_module_entry_point(self, app_module, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        """Test running the CLI via python -m fast_llms_txt."""
+        output = tmp_path / "llms.txt"
+        argv = ["fast_llms_txt", "build", f"{app_module}:app", "-o", str(output)]
+        monkeypatch.setattr(sys, "argv", argv)
+
+        with pytest.raises(SystemExit) as exc_info:
+            runpy.run_module("fast_llms_txt", run_name="__main__")
+
+        assert exc_info.value.code == 0
+        assert output.is_file()
@@ -1,6 +1,6 @@
 """Tests for the generator module."""
 
-from fast_llms_txt.generator import generate_llms_txt
+from fast_llms_txt.generator import _resolve_ref, generate_llms_txt
 
 
 class TestGenerateLlmsTxt:
@@ -692,3 +692,81 @@ class TestGenerateLlmsTxt:
         # Item properties are in schema definitions
         assert "`id` (string)" in result
         assert "`value` (number)" in result
+
+    def test_self_referential_schema(self):
+        """Test that recursive schemas render without following refs forever."""
+        schema = {
+            "info": {"title": "API"},
+            "paths": {
+                "/trees": {
+                    "post": {
+                        "requestBody": {
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "object",
+                                        "properties": {
+                                            "root": {"$ref": "#/components/schemas/Tree"},
+                                        },
+                                    }
+                                }
+                            }
+                        },
+                        "responses": {
+                            "200": {
+                                "description": "Created",
+                                "content": {
+                                    "application/json": {
+                                        "schema": {"$ref": "#/components/schemas/Tree"}
+                                    }
+                                },
+                            }
+                        },
+                    }
+                }
+            },
+            "components": {
+                "schemas": {
+                    "Tree": {
+                        "type": "object",
+                        "properties": {
+                            "parent": {"$ref": "#/components/schemas/Tree"},
+                            "children": {
+                                "type": "array",
+                                "items": {"$ref": "#/components/schemas/Tree"},
+                            },
+                        },
+                    }
+                }
+            },
+        }
+
+        result = generate_llms_txt(schema)
+
+        assert "`parent` ($Tree)" in result
+        assert "`children` (array[$Tree])" in result
+        assert "`root` ($Tree, optional)" in result
+        assert "**Returns** (200): $Tree - Created" in result
+
+
+class TestResolveRef:
+    """Tests for _resolve_ref helper."""
+
+    def test_returns_shared_definition(self):
+        """Test that refs resolve to the component dict itself, not a copy."""
+        user = {"type": "object", "properties": {"id": {"type": "integer"}}}
+        schemas = {"User": user}
+
+        first = _resolve_ref({"$ref": "#/components/schemas/User"}, schemas)
+        second = _resolve_ref({"$ref": "#/components/schemas/User"}, schemas)
+
+        assert first is user
+        assert second is first
+
+    def test_unresolvable_ref_returns_input(self):
+        """Test that unknown or non-local refs are returned unchanged."""
+        missing = {"$ref": "#/components/schemas/Missing"}
+        external = {"$ref": "other.json#/User"}
+
+        assert _resolve_ref(missing, {}) is missing
+        assert _resolve_ref(external, {}) is external